@@ -39,7 +39,12 @@ class Dao:
         return order
 
 
-def validate_something_static(service, order: Order):
+@dataclass
+class OrderValidationContext:
+    today: datetime.date
+
+
+def validate_something_static(service, context: OrderValidationContext, order: Order):
     ...
 
 
@@ -55,23 +60,30 @@ class OrderService:
     def create_order(self, order: Order) -> Order:
         return Dao.create_order(order)
 
+    @create_order.validator_context
+    def make_order_validation_context(self, order: Order) -> OrderValidationContext:
+        # Shared by the validators, so the date is only looked up once per call
+        return OrderValidationContext(today=datetime.date.today())
+
     @create_order.validate
-    def validate_order_items(self, order: Order):
+    def validate_order_items(self, context: OrderValidationContext, order: Order):
         if not order.items:
             raise ServiceValidationError("Order requires order items")
         return order
 
     @create_order.validate
-    def validate_order_shipping_date_not_in_past(self, order: Order):
-        if not order.shipping_date >= datetime.date.today():
+    def validate_order_shipping_date_not_in_past(
+        self, context: OrderValidationContext, order: Order
+    ):
+        if not order.shipping_date >= context.today:
             raise ServiceValidationError("Order shipping date is in the past")
         return order
 
     @create_order.validate
-    def validate_order_shipping_date_not_too_soon(self, order: Order):
-        if (
-            order.shipping_date - datetime.date.today()
-        ) < self.minimum_shipping_duration:
+    def validate_order_shipping_date_not_too_soon(
+        self, context: OrderValidationContext, order: Order
+    ):
+        if (order.shipping_date - context.today) < self.minimum_shipping_duration:
             raise ServiceValidationError(
                 "Order shipping date is too soon, not enough time to prepare"
             )
@@ -1,7 +1,10 @@
-from distutils.version import LooseVersion
+import re
 
 __version__ = "2.1.3"
-__version_info__ = tuple(LooseVersion(__version__).version)
+__version_info__ = tuple(
+    int(part) if part.isdigit() else part
+    for part in re.findall(r"\d+|[a-z]+", __version__)
+)
 
 
 from .service import ServiceAction, ServiceValidationError, action
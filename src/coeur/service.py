@@ -2,128 +2,196 @@ from __future__ import annotations
 
 from contextlib import contextmanager
 from functools import partial, wraps
-from typing import Any, Callable
+from inspect import Parameter, Signature, signature
+from typing import Any, Callable, Iterable
+
+# Marks validators that aren't bound to any instance
+_NO_SELF = object()
 
 
 class ServiceValidationError(Exception):
     def __init__(self, message: str | None = None, details: dict | None = None):
         self.message = message
         self.details = details
-        super().__init__(message)
+        # Reset the args set from the positional arguments, so a missing message
+        # leaves them empty however it was passed
+        super().__init__(*(() if message is None else (message,)))
 
 
-def make_wrapped_method(action, caller):
-    """A class factory is used to create the wrapped method. It allows the __call__ method to be
-    wrapped with the correct signature for each instance."""
+class _ValidatorList(list):
+    """The validators of an action as a list. The action keeps an immutable copy,
+    so any change made to this list is written back to the action."""
+
+    __slots__ = ("_action",)
+
+    def __init__(self, action: ServiceAction, validators: Iterable[Callable]):
+        super().__init__(validators)
+        self._action = action
+
+
+def _write_back(name: str) -> Callable:
+    """Wrap the list method so the action is updated after it runs"""
+    method = getattr(list, name)
+
+    @wraps(method)
+    def write_back(self: _ValidatorList, *args, **kwargs):
+        result = method(self, *args, **kwargs)
+        self._action.validators = self
+        return result
 
-    class _WrappedMethod:
-        """A wrapper for the service action registered method. It provides tools
-        for overriding the registered validators, useful for testing purposes."""
-
-        def __init__(self):
-            """Set the args despite using a factory to allow the action to
-            be accessed through the method.
-
-            Example:
-                my_action = my_service.my_method.action
-            """
-            self.action = action
-
-        __call__ = wraps(action.registered_method)(partial(action.__call__, caller))
-
-        @property
-        def validators(self) -> list[Callable]:
-            """A proxy getter for the action validators"""
-            return action.validators
-
-        @validators.setter
-        def validators(self, validators: list[Callable]):
-            """A proxy setter for the action validators"""
-            action.validators = validators
-
-        @contextmanager
-        def only(self, validators: list[str]):
-            """A context manager for running only the validators with the given names.
-
-            Note:
-                Validator functions with the same names aren't distinguished
-
-            Example:
-                class Service:
-                    @action(validators=[a, b])
-                    def my_action(self, my_arg):
-                        ...
-
-                service = Service()
-                with Service().my_action.only([a.__name__]):
-                    service.my_action(my_arg=my_arg)
-            """
-            existing = self.validators
-            self.validators = [
-                existing for existing in existing if existing.__name__ in validators
-            ]
-            try:
-                yield
-                self.validators = existing
-            except Exception:
-                self.validators = existing
-                raise
-
-        @contextmanager
-        def using(self, validators: list[Callable]):
-            """A context manager for calling the action with overridden validators applied to it
-
-            Example:
-                class Service:
-                    @action(validators=[a, b])
-                    def my_action(self, my_arg):
-                        ...
-
-                service = Service()
-                with Service().my_action.using([a]):
-                    service.my_action(my_arg=my_arg)
-            """
-            existing = self.validators
-            self.validators = validators
-            try:
-                yield
-                self.validators = existing
-            except Exception:
-                self.validators = existing
-                raise
-
-        @contextmanager
-        def excluding(self, validators: list[str]):
-            """A context manager for excluding the given validator names.
-
-            Note:
-                Validator functions with the same names aren't distinguished
-
-            Example:
-                class Service:
-                    @action(validators=[a, b])
-                    def my_action(self, my_arg):
-                        ...
-
-                service = Service()
-                with Service().my_action.exclude([a.__name__]):
-                    service.my_action(my_arg=my_arg)
-            """
-            existing = self.validators
-            self.validators = [
-                existing for existing in existing if existing.__name__ not in validators
-            ]
-            try:
-                yield
-                self.validators = existing
-            except Exception:
-                self.validators = existing
-                raise
-
-    return _WrappedMethod()
+    return write_back
+
+
+for _name in (
+    "__delitem__",
+    "__iadd__",
+    "__imul__",
+    "__setitem__",
+    "append",
+    "clear",
+    "extend",
+    "insert",
+    "pop",
+    "remove",
+    "reverse",
+    "sort",
+):
+    setattr(_ValidatorList, _name, _write_back(_name))
+del _name
+
+
+class _WrappedMethod:
+    """A wrapper for the service action registered method, binding it to the caller.
+    It provides tools for overriding the registered validators, useful for testing purposes."""
+
+    __slots__ = ("action", "caller")
+
+    def __init__(self, action: ServiceAction, caller: Any):
+        """Keep a reference to the action to allow it to be accessed through the method.
+
+        Example:
+            my_action = my_service.my_method.action
+        """
+        self.action = action
+        self.caller = caller
+
+    def __call__(self, *args, **kwargs):
+        # Go straight to the dispatch, skipping the ServiceAction.run frame
+        action = self.action
+        return (action._dispatch or action._compile())(self.caller, *args, **kwargs)
+
+    @property
+    def __signature__(self) -> Signature:
+        """The signature of the registered method, without the bound caller.
+
+        Raises:
+            AttributeError: If no method is registered for the action
+        """
+        registered_method = self.action.registered_method
+        if not registered_method:
+            raise AttributeError("Method not set for action")
+
+        sig = signature(registered_method)
+        parameters = tuple(sig.parameters.values())
+        if parameters and parameters[0].kind in (
+            Parameter.POSITIONAL_ONLY,
+            Parameter.POSITIONAL_OR_KEYWORD,
+        ):
+            # The caller is passed as the first positional argument
+            parameters = parameters[1:]
+        return sig.replace(parameters=parameters)
+
+    @property
+    def validators(self) -> list[Callable]:
+        """A proxy getter for the action validators"""
+        return self.action.validators
+
+    @validators.setter
+    def validators(self, validators: Iterable[Callable]):
+        """A proxy setter for the action validators"""
+        self.action.validators = validators
+
+    @contextmanager
+    def only(self, validators: list[str]):
+        """A context manager for running only the validators with the given names.
+
+        Note:
+            Validator functions with the same names aren't distinguished
+
+        Example:
+            class Service:
+                @action(validators=[a, b])
+                def my_action(self, my_arg):
+                    ...
+
+            service = Service()
+            with Service().my_action.only([a.__name__]):
+                service.my_action(my_arg=my_arg)
+        """
+        saved = self.validators
+        names = frozenset(validators)
+        self.validators = [v for v in saved if v.__name__ in names]
+        try:
+            yield
+        finally:
+            self.validators = saved
+
+    @contextmanager
+    def using(self, validators: list[Callable]):
+        """A context manager for calling the action with overridden validators applied to it
+
+        Example:
+            class Service:
+                @action(validators=[a, b])
+                def my_action(self, my_arg):
+                    ...
+
+            service = Service()
+            with Service().my_action.using([a]):
+                service.my_action(my_arg=my_arg)
+        """
+        saved = self.validators
+        self.validators = validators
+        try:
+            yield
+        finally:
+            self.validators = saved
+
+    @contextmanager
+    def excluding(self, validators: list[str]):
+        """A context manager for excluding the given validator names.
+
+        Note:
+            Validator functions with the same names aren't distinguished
+
+        Example:
+            class Service:
+                @action(validators=[a, b])
+                def my_action(self, my_arg):
+                    ...
+
+            service = Service()
+            with Service().my_action.exclude([a.__name__]):
+                service.my_action(my_arg=my_arg)
+        """
+        saved = self.validators
+        names = frozenset(validators)
+        self.validators = [v for v in saved if v.__name__ not in names]
+        try:
+            yield
+        finally:
+            self.validators = saved
 
 
 class ServiceAction:
+    __slots__ = (
+        "_registered_method",
+        "_validator_context_factory",
+        "_validators",
+        "_validator_plan",
+        "_dispatch",
+    )
+
     def __init__(
         self,
         registered_method: Callable | None = None,
@@ -136,6 +204,83 @@ class ServiceAction:
         self.validator_context_factory = validator_context_factory
         self.validators = validators or []
 
+    def __set_name__(self, owner, name):
+        """This runs once the owner class body has been executed, so any validators
+        registered by decorator are known and the dispatch can be built up front.
+        """
+        if self._registered_method:
+            self._compile()
+
+    @property
+    def registered_method(self) -> Callable | None:
+        """The method wrapped by this action"""
+        return self._registered_method
+
+    @registered_method.setter
+    def registered_method(self, registered_method: Callable | None):
+        self._registered_method = registered_method
+        self._dispatch = None
+
+    @property
+    def validator_context_factory(self) -> Callable | None:
+        """The factory for the context passed to each validator"""
+        return self._validator_context_factory
+
+    @validator_context_factory.setter
+    def validator_context_factory(self, validator_context_factory: Callable | None):
+        self._validator_context_factory = validator_context_factory
+        self._dispatch = None
+
+    @property
+    def validators(self) -> list[Callable]:
+        """The registered validators, in order of execution.
+        Changes made to the returned list are applied to the action."""
+        return _ValidatorList(self, self._validators)
+
+    @validators.setter
+    def validators(self, validators: Iterable[Callable]):
+        """Set the validators, rebuilding the validator plan used by run
+
+        Raises:
+            TypeError: If any of the validators isn't callable
+        """
+        validators = tuple(validators)
+        self._validator_plan = tuple(self._plan_validator(v) for v in validators)
+        self._validators = validators
+        self._dispatch = None
+
+    @staticmethod
+    def _plan_validator(validator: Callable) -> tuple[Callable, Any]:
+        """Pair the validator with the instance it is bound to (if any).
+
+        This is more complex than it seems.
+
+        Decorator registered validators are unbound at registration time, but bind after,
+        so the default behaviour of passing the service is fine.
+
+        Validators passed as options are unbound to the given service,
+        so the default behaviour of injecting the service is fine.
+
+        Bound validators (from either the service class, or external class instances)
+        can be registered afterwards.
+
+        For external bound methods, it is ok to inject service.
+
+        For methods bound to the actions service though,
+        it doesn't make sense for python to implicitly pass self
+        and then for this method to inject the service again.
+
+        So any bound validator that is bound to the given caller skips the service injection
+        and relies on the implicitly self injection. The bound instance is resolved once here,
+        leaving only an identity check against the caller to be done per call.
+
+        Raises:
+            TypeError: If the validator isn't callable
+        """
+        if not callable(validator):
+            raise TypeError(f"Validator {validator!r} is not callable")
+        return validator, getattr(validator, "__self__", _NO_SELF)
+
     def __get__(self, obj, objtype=None):
         """The service actions are used in other classes as methods.
         Overriding __get__ allows us to return a reference the registered service action method,
@@ -162,7 +307,7 @@ class ServiceAction:
         Then when the wrapped method is called, the registered method is called,
         and the caller is passed as the self parameter.
         """
-        return make_wrapped_method(action=self, caller=obj)
+        return _WrappedMethod(self, obj)
 
     def run(self, caller: Any, *args, **kwargs):
         """Call the registered method (if there is one),
@@ -172,51 +317,58 @@ class ServiceAction:
         Raises:
             ValueError: If no method is registered for this action
         """
-        if not self.registered_method:
+        return (self._dispatch or self._compile())(caller, *args, **kwargs)
+
+    def _compile(self) -> Callable:
+        """Build the function that run dispatches to, specialised for the current
+        method, validators and context factory. It is rebuilt after any of them change.
+
+        Raises:
+            ValueError: If no method is registered for this action
+        """
+        registered_method = self._registered_method
+        if not registered_method:
             raise ValueError("Method not set for action")
 
-        if self.validators:
+        validator_plan = self._validator_plan
+        context_factory = self._validator_context_factory
 
-            context = (
-                self.validator_context_factory(caller, *args, **kwargs)
-                if self.validator_context_factory
-                else None
-            )
+        if not validator_plan:
+            # Nothing to validate (and so no context to build), call the method as is
+            dispatch = registered_method
 
-            for validator in self.validators:
-                """This is more complex than it seems.
+        elif context_factory:
 
-                Decorator registered validators are unbound at registration time, but bind after,
-                so the default behaviour of passing the service is fine.
+            def dispatch(caller, *args, **kwargs):
+                context = context_factory(caller, *args, **kwargs)
 
-                Validators passed as options are unbound to the given service,
-                so the default behaviour of injecting the service is fine.
+                # A falsy context isn't passed to the validators
+                validator_args = (context, *args) if context else args
 
-                Bound validators (from either the service class, or external class instances)
-                can be registered afterwards.
+                for validator, owner in validator_plan:
+                    if owner is caller:
+                        validator(*validator_args, **kwargs)
+                    else:
+                        validator(caller, *validator_args, **kwargs)
 
-                For external bound methods, it is ok to inject service.
+                return registered_method(caller, *args, **kwargs)
 
-                For methods bound to the actions service though,
-                it doesn't make sense for python to implicitly pass self
-                and then for this method to inject the service again.
+        else:
 
-                So any bound validator that is bound to the given caller skips the service injection
-                and relies on the implicitly self injection.
-                """
-                self_bound = getattr(validator, "__self__", None) == caller
-                validator_args = list(args)
-                if context:
-                    validator_args.insert(0, context)
-                if not self_bound:
-                    validator_args.insert(0, caller)
+            def dispatch(caller, *args, **kwargs):
+                for validator, owner in validator_plan:
+                    if owner is caller:
+                        validator(*args, **kwargs)
+                    else:
+                        validator(caller, *args, **kwargs)
 
-                validator(*validator_args, **kwargs)
+                return registered_method(caller, *args, **kwargs)
 
-        return self.registered_method(caller, *args, **kwargs)
+        self._dispatch = dispatch
+        return dispatch
 
     def __call__(self, caller: Any, *args, **kwargs):
-        return self.run(caller=caller, *args, **kwargs)
+        return (self._dispatch or self._compile())(caller, *args, **kwargs)
 
     def register(self, func: Callable) -> Callable:
         """Register the method that this service action is wrapping
@@ -231,8 +383,15 @@ class ServiceAction:
 
     def validate(self, func: Callable) -> Callable:
         """Optionally register any additional validators.
-        These are executed in order of registration"""
-        self.validators.append(func)
+        These are executed in order of registration
+
+        Raises:
+            TypeError: If the validator isn't callable
+        """
+        plan = self._plan_validator(func)
+        self._validators += (func,)
+        self._validator_plan += (plan,)
+        self._dispatch = None
         return func
 
     def validator_context(self, func: Callable) -> Callable:
@@ -257,6 +416,7 @@ def make_service_action(registered_method: Callable, **options):
     wrapped with the correct signature for each instance."""
 
     class _ServiceAction(ServiceAction):
+        __slots__ = ()
         __call__ = wraps(registered_method)(ServiceAction.__call__)
 
     return _ServiceAction(registered_method=registered_method, **options)
@@ -286,11 +446,7 @@ def action(func: Callable | None = None, /, **options):
                 def my_action(self):
                     ...
     """
-    if not func:
-
-        def inner(func) -> ServiceAction:
-            return make_service_action(registered_method=func, **options)
-
-        return inner
+    if func is None:
+        return partial(make_service_action, **options)
 
-    return make_service_action(registered_method=func, **options)
+    return make_service_action(func, **options)
@@ -1,34 +1,113 @@
 from __future__ import annotations
 
+import copy
+import pickle
+import sys
 from inspect import Parameter, Signature, signature
 from unittest.mock import Mock, call, sentinel
 
 import pytest
 
-from coeur import ServiceValidationError, action
+from coeur import ServiceAction, ServiceValidationError, action
 
 
-def test_service_action_ko_multiple_contexts_defined():
-    """Assert than an error is raised if a second validator context factory is registered"""
+def test_service_validation_error():
+    error = ServiceValidationError("message", details={"field": "invalid"})
+    assert error.args == ("message",)
+    assert error.message == "message"
+    assert error.details == {"field": "invalid"}
+
+    for error in [
+        ServiceValidationError(),
+        ServiceValidationError(None),
+        ServiceValidationError(message=None),
+        ServiceValidationError(None, {"field": "invalid"}),
+    ]:
+        assert error.args == ()
+        assert str(error) == ""
+        assert error.message is None
+
+
+@pytest.mark.parametrize("message", ["message", None])
+def test_service_validation_error_copy_and_pickle(message):
+    error = ServiceValidationError(message, details={"field": "invalid"})
+
+    for restored in [copy.copy(error), pickle.loads(pickle.dumps(error))]:
+        assert restored.args == error.args
+        assert restored.message == message
+        assert restored.details == {"field": "invalid"}
+
+
+def define_service_with_multiple_contexts():
+    class Service:
+        @action
+        def my_action(self, data):
+            ...
+
+        @my_action.validator_context
+        def get_context(self, data):
+            return {}
+
+        @my_action.validator_context
+        def get_context_again(self, data):
+            return {}
+
+
+def define_service_with_multiple_methods():
+    class Service:
+        @action
+        def my_action(self):
+            ...
+
+        @my_action.register
+        def second_method(self):
+            ...
+
+
+@pytest.mark.parametrize(
+    "define_service, expected",
+    [
+        (
+            define_service_with_multiple_contexts,
+            "ValueError('Validator context factory already set for action')",
+        ),
+        (
+            define_service_with_multiple_methods,
+            "ValueError('Method already set for action')",
+        ),
+    ],
+    ids=["multiple_contexts_defined", "method_already_set"],
+)
+def test_service_action_ko_already_set(define_service, expected):
+    """Assert that an error is raised if a second validator context factory
+    or a second method is registered"""
     with pytest.raises(ValueError) as ctx:
+        define_service()
+
+    assert repr(ctx.value) == expected
 
-        class Service:
-            @action
-            def my_action(self, data):
-                ...
 
-            @my_action.validator_context
-            def get_context(self, data):
-                return {}
+def test_service_action_ko_validator_not_callable():
+    """Assert that an error is raised when registering a validator, not when calling the action"""
+
+    class Service:
+        @action
+        def my_action(self):
+            ...
 
-            @my_action.validator_context
-            def get_context_again(self, data):
-                return {}
+    with pytest.raises(TypeError) as ctx:
+        Service.my_action.action.validate("not_a_validator")
 
     assert (
-        repr(ctx.value)
-        == "ValueError('Validator context factory already set for action')"
+        repr(ctx.value) == "TypeError(\"Validator 'not_a_validator' is not callable\")"
     )
+    assert Service.my_action.validators == []
+
+    with pytest.raises(TypeError):
+        with Service().my_action.using([None]):
+            ...
+
+    assert Service.my_action.validators == []
 
 
 def test_service_action_with_context():
@@ -86,6 +165,63 @@ def test_service_action_without_options_input():
     perform.assert_called_with(self=service, data=sentinel.data)
 
 
+def test_service_action_positional_arguments():
+    validator = Mock()
+    perform = Mock()
+
+    class Service:
+        @action
+        def my_action(self, a, b):
+            return perform(self=self, a=a, b=b)
+
+        @my_action.validate
+        def validate_action(self, a, b):
+            validator(self=self, a=a, b=b)
+
+    service = Service()
+    output = service.my_action(sentinel.a, b=sentinel.b)
+    assert output == perform.return_value
+    validator.assert_called_with(self=service, a=sentinel.a, b=sentinel.b)
+    perform.assert_called_with(self=service, a=sentinel.a, b=sentinel.b)
+
+
+def test_service_action_call_frames():
+    """Only the wrapped method and the dispatch sit between the caller and a validator"""
+    frames = []
+
+    class Service:
+        @action
+        def my_action(self):
+            pass
+
+        @my_action.validate
+        def validate(self):
+            frame = sys._getframe(1)
+            while frame.f_code is not test_service_action_call_frames.__code__:
+                frames.append(frame.f_code.co_name)
+                frame = frame.f_back
+
+    Service().my_action()
+    assert frames == ["dispatch", "__call__"]
+
+
+def test_service_action_called_directly():
+    validator = Mock()
+
+    class Service:
+        @action
+        def my_action(self, data):
+            return data
+
+    service = Service()
+    my_action = Service.my_action.action
+    assert my_action(service, sentinel.data) == sentinel.data
+
+    my_action.validate(lambda service, data: validator(service=service, data=data))
+    assert my_action(service, data=sentinel.data) == sentinel.data
+    validator.assert_called_with(service=service, data=sentinel.data)
+
+
 def test_service_action_validator_raise():
     """Test that any validations have their exceptions raised"""
 
@@ -152,7 +288,11 @@ def test_service_action_external_bound_validator():
     )
 
 
-def test_service_action_internal_bound_validator__lazy_registration_on_non_instance():
+@pytest.mark.parametrize(
+    "register_mode",
+    ["on_non_instance", "on_instance", "on_instance_of_static_validator"],
+)
+def test_service_action_internal_bound_validator__lazy_registration(register_mode):
     internal_validator = Mock()
 
     class Service:
@@ -161,15 +301,27 @@ def test_service_action_internal_bound_validator__lazy_registration_on_non_insta
             pass
 
         def lazy_registered_validator(self):
-            internal_validator(self=self)
+            internal_validator(service=self)
+
+        @staticmethod
+        def lazy_registered_static_validator(service):
+            internal_validator(service=service)
 
-    Service.my_action.action.validate(Service.lazy_registered_validator)
     service = Service()
+    validator = {
+        "on_non_instance": Service.lazy_registered_validator,
+        "on_instance": service.lazy_registered_validator,
+        "on_instance_of_static_validator": service.lazy_registered_static_validator,
+    }[register_mode]
+
+    service.my_action.action.validate(validator)
     service.my_action()
-    internal_validator.assert_called_with(self=service)
+    internal_validator.assert_called_with(service=service)
 
 
-def test_service_action_internal_bound_validator__lazy_registration_on_instance():
+def test_service_action_internal_bound_validator__equal_instance():
+    """A validator bound to a different instance is external,
+    even when that instance compares equal to the caller"""
     internal_validator = Mock()
 
     class Service:
@@ -177,31 +329,131 @@ def test_service_action_internal_bound_validator__lazy_registration_on_instance(
         def my_action(self):
             pass
 
-        def lazy_registered_validator(self):
-            internal_validator(self=self)
+        def lazy_registered_validator(self, service):
+            internal_validator(self=self, service=service)
+
+        def __eq__(self, other):
+            return isinstance(other, Service)
 
     service = Service()
-    service.my_action.action.validate(service.lazy_registered_validator)
+    other = Service()
+    service.my_action.action.validate(other.lazy_registered_validator)
     service.my_action()
-    internal_validator.assert_called_with(self=service)
+    internal_validator.assert_called_with(self=other, service=service)
 
 
-def test_service_action_internal_bound_validator__lazy_registration_on_instance_of_static_validator():
-    internal_validator = Mock()
+def test_service_action_validator_registered_after_call():
+    """Validators and context factories registered after the action has been
+    called are applied to the following calls"""
+    context = Mock()
+    validator = Mock()
+
+    class Service:
+        @action
+        def my_action(self, data):
+            return data
+
+    service = Service()
+    assert service.my_action(sentinel.data) == sentinel.data
+
+    def validate(service, context, data):
+        validator(service=service, context=context, data=data)
+
+    service.my_action.action.validate(validate)
+    service.my_action.action.validator_context(lambda service, data: context)
+    service.my_action(data=sentinel.data)
+    validator.assert_called_with(service=service, context=context, data=sentinel.data)
+
+
+def test_service_action_shared_validators_option():
+    """Actions initialised with the same validators list don't share registrations"""
+    log = Mock()
+
+    def validate_a(service):
+        log("a")
+
+    validators = [validate_a]
+
+    class Service:
+        @action(validators=validators)
+        def first_action(self):
+            pass
+
+        @action(validators=validators)
+        def second_action(self):
+            pass
+
+        @first_action.validate
+        def validate_b(self):
+            log("b")
+
+    service = Service()
+    service.second_action()
+    assert log.call_args_list == [call("a")]
+    assert validators == [validate_a]
+
+
+def test_service_action_validators_mutated_in_place():
+    """Changes made to the validators list are applied to the action"""
+    log = Mock()
+
+    def validate_a(service):
+        log("a")
+
+    def validate_b(service):
+        log("b")
 
     class Service:
         @action
         def my_action(self):
             pass
 
-        @staticmethod
-        def lazy_registered_validator(service):
-            internal_validator(service=service)
+    service = Service()
+    Service.my_action.action.validators.append(validate_a)
+    service.my_action.validators += [validate_b]
+    service.my_action()
+    assert log.call_args_list == [call("a"), call("b")]
+    log.reset_mock()
+
+    service.my_action.validators.reverse()
+    service.my_action()
+    assert log.call_args_list == [call("b"), call("a")]
+    log.reset_mock()
+
+    del service.my_action.validators[0]
+    service.my_action()
+    assert log.call_args_list == [call("a")]
+    assert Service.my_action.validators == [validate_a]
+
+    with pytest.raises(TypeError):
+        service.my_action.validators.append(None)
+
+    assert Service.my_action.validators == [validate_a]
+
+
+def test_service_action_validators_from_iterator():
+    log = Mock()
+
+    def validate_a(service):
+        log("a")
+
+    def validate_b(service):
+        log("b")
+
+    class Service:
+        @action(validators=(v for v in [validate_a]))
+        def my_action(self):
+            pass
 
     service = Service()
-    service.my_action.action.validate(service.lazy_registered_validator)
+    assert service.my_action.validators == [validate_a]
+
+    with service.my_action.using(v for v in [validate_b]):
+        assert service.my_action.validators == [validate_b]
+        service.my_action()
+
     service.my_action()
-    internal_validator.assert_called_with(service=service)
+    assert log.call_args_list == [call("b"), call("a")]
 
 
 def test_service_action_validator_call_order():
@@ -237,22 +489,6 @@ def test_service_action_validator_call_order():
     ]
 
 
-def test_service_action_ko_method_already_set():
-    """Assert that an error is raised if we attempt to register a second method"""
-    with pytest.raises(ValueError) as ctx:
-
-        class Service:
-            @action
-            def my_action(self):
-                ...
-
-            @my_action.register
-            def second_method(self):
-                ...
-
-    assert repr(ctx.value) == "ValueError('Method already set for action')"
-
-
 def test_service_action_with_no_parameters():
     """Simple test to make sure the flow works when no parameters are required by the action method"""
 
@@ -270,12 +506,14 @@ def test_service_action_with_no_parameters():
     assert output == sentinel.output
 
 
-def test_service_action_wrapped_method_using():
-    validator_a = Mock()
-    validator_b = Mock()
+@pytest.fixture(scope="module")
+def service_with_two_validators():
+    """A service shared by the validator override tests,
+    the overrides restore the validators on exit"""
+    log = Mock()
 
     def validate_a(service):
-        validator_a()
+        log("a")
 
     class Service:
         @action(validators=[validate_a])
@@ -284,26 +522,62 @@ def test_service_action_wrapped_method_using():
 
         @my_action.validate
         def validate_b(self):
-            validator_b()
+            log("b")
 
+    return Service, log
+
+
+@pytest.mark.parametrize(
+    "method, get_validators, expected_names, expected_calls",
+    [
+        ("using", lambda service: [service.validate_b], ["validate_b"], [call("b")]),
+        ("excluding", lambda service: ["validate_a"], ["validate_b"], [call("b")]),
+        ("only", lambda service: ["validate_a"], ["validate_a"], [call("a")]),
+    ],
+    ids=["using", "excluding", "only"],
+)
+def test_service_action_wrapped_method_override(
+    service_with_two_validators, method, get_validators, expected_names, expected_calls
+):
+    Service, log = service_with_two_validators
+    log.reset_mock()
     service = Service()
-    # Assert the initial state
-    assert [v.__name__ for v in service.my_action.action.validators] == [
+
+    # Check the initial state
+    service.my_action()
+    assert log.call_args_list == [call("a"), call("b")]
+    log.reset_mock()
+
+    # Check the overridden state
+    with getattr(service.my_action, method)(get_validators(service)):
+        assert [
+            v.__name__ for v in service.my_action.action.validators
+        ] == expected_names
+        service.my_action()
+    assert log.call_args_list == expected_calls
+    log.reset_mock()
+
+    # Check the final state
+    service.my_action()
+    assert log.call_args_list == [call("a"), call("b")]
+    assert [v.__name__ for v in service.my_action.validators] == [
         "validate_a",
         "validate_b",
     ]
 
-    with service.my_action.using([service.validate_b]):
-        assert [v.__name__ for v in service.my_action.action.validators] == [
-            "validate_b"
-        ]
-        service.my_action()
 
-    validator_a.assert_not_called()
-    validator_b.assert_called()
+@pytest.mark.parametrize("method", ["using", "excluding", "only"])
+def test_service_action_wrapped_method_restored_on_error(
+    service_with_two_validators, method
+):
+    Service, _ = service_with_two_validators
+    service = Service()
+
+    with pytest.raises(ServiceValidationError):
+        with getattr(service.my_action, method)([]):
+            raise ServiceValidationError()
 
-    # Assert the final state
-    assert [v.__name__ for v in service.my_action.action.validators] == [
+    assert [v.__name__ for v in service.my_action.validators] == [
         "validate_a",
         "validate_b",
     ]
@@ -364,78 +638,95 @@ def test_service_action_wrapped_method_using__bound_method__service_bound():
     validator.assert_called_with(self=service, data=sentinel.data)
 
 
-def test_service_action_wrapped_method_exclude():
-    log = Mock()
+def test_service_action_skip_context_if_no_validators():
+    context = Mock()
 
     class Service:
         @action
         def my_action(self):
             pass
 
-        @my_action.validate
-        def validate_a(self):
-            log("a")
+        @my_action.validator_context
+        def make_context(self):
+            context()
 
-        @my_action.validate
-        def validate_b(self):
-            log("b")
+    Service().my_action()
+    context.assert_not_called()
+
+
+def test_service_action_wrapped_method_bound_per_instance():
+    class Service:
+        @action
+        def my_action(self):
+            return self
 
     service = Service()
+    other = Service()
+    assert service.my_action() is service
+    assert other.my_action() is other
+    assert vars(service) == {}
 
-    # Check the initial state
-    service.my_action()
-    assert log.call_args_list == [call("a"), call("b")]
-    log.reset_mock()
 
-    # Check the excluded state
-    with service.my_action.excluding([service.validate_a.__name__]):
-        service.my_action()
-    assert log.call_args_list == [call("b")]
-    log.reset_mock()
+def test_service_action_overridden_in_subclass():
+    log = Mock()
 
-    # Check the final state
-    service.my_action()
-    assert log.call_args_list == [call("a"), call("b")]
-    log.reset_mock()
+    class Base:
+        @action
+        def my_action(self):
+            log("base")
 
+    class Child(Base):
+        @action
+        def my_action(self):
+            log("child")
+            super().my_action()
 
-def test_service_action_wrapped_method_only():
-    log = Mock()
+    child = Child()
+    assert super(Child, child).my_action.action is Base.my_action.action
+    assert child.my_action.action is Child.my_action.action
 
+    child.my_action()
+    assert log.call_args_list == [call("child"), call("base")]
+
+
+def test_service_action_copied_instance():
     class Service:
+        def __init__(self, value):
+            self.value = value
+
         @action
         def my_action(self):
-            pass
+            return self.value
 
-        @my_action.validate
-        def validate_a(self):
-            log("a")
+    service = Service(sentinel.original)
+    service.my_action()
 
-        @my_action.validate
-        def validate_b(self):
-            log("b")
+    copied = copy.copy(service)
+    copied.value = sentinel.copied
+    assert copied.my_action() == sentinel.copied
+    assert service.my_action() == sentinel.original
 
-    service = Service()
 
-    # Check the initial state
-    service.my_action()
-    assert log.call_args_list == [call("a"), call("b")]
-    log.reset_mock()
+class PicklableService:
+    def __init__(self, value):
+        self.value = value
 
-    # Check the excluded state
-    with service.my_action.only([service.validate_a.__name__]):
-        service.my_action()
-    assert log.call_args_list == [call("a")]
-    log.reset_mock()
+    @action
+    def my_action(self):
+        return self.value
 
-    # Check the final state
+
+def test_service_action_pickled_instance():
+    service = PicklableService(1)
     service.my_action()
-    assert log.call_args_list == [call("a"), call("b")]
-    log.reset_mock()
 
+    restored = pickle.loads(pickle.dumps(service))
+    assert restored.my_action() == 1
 
-def test_service_action_skip_context_if_no_validators():
+
+def test_service_action_skip_context_if_validators_filtered_out():
     context = Mock()
+    validator = Mock()
 
     class Service:
         @action
@@ -446,8 +737,34 @@ def test_service_action_skip_context_if_no_validators():
         def make_context(self):
             context()
 
-    Service().my_action()
+        @my_action.validate
+        def validate_a(self, context):
+            validator()
+
+    service = Service()
+    with service.my_action.excluding([service.validate_a.__name__]):
+        service.my_action()
+
     context.assert_not_called()
+    validator.assert_not_called()
+
+
+def test_service_action_wrapped_method_slotted_instance():
+    """Actions work on instances without a __dict__"""
+
+    class Service:
+        __slots__ = ("value",)
+
+        def __init__(self, value):
+            self.value = value
+
+        @action
+        def my_action(self):
+            return self.value
+
+    service = Service(sentinel.value)
+    assert service.my_action() == sentinel.value
+    assert service.my_action.action is Service.my_action.action
 
 
 def test_service_action_class_signature():
@@ -464,6 +781,27 @@ def test_service_action_class_signature():
     )
 
 
+def test_service_action_class_signature__variadic():
+    class Service:
+        @action
+        def my_action(*args, **kwargs):
+            return
+
+    assert signature(Service().my_action) == Signature(
+        parameters=[
+            Parameter("args", Parameter.VAR_POSITIONAL),
+            Parameter("kwargs", Parameter.VAR_KEYWORD),
+        ]
+    )
+
+
+def test_service_action_class_signature__no_method():
+    class Service:
+        my_action = ServiceAction()
+
+    assert not hasattr(Service().my_action, "__signature__")
+
+
 @pytest.mark.skip("This doesnt work yet")
 def test_service_action_signature():
     def my_action(a: int, b: int):